@@ -153,6 +153,31 @@ export default function SettingsPage() {
     queryFn: settingsApi.getAiSettings,
   })
 
+  // Sync projection state
+  const [syncIncludeArchived, setSyncIncludeArchived] = useState(false)
+  const [syncIncludeTrashed, setSyncIncludeTrashed] = useState(false)
+  const [syncLabelAllow, setSyncLabelAllow] = useState("")
+  const [syncLabelDeny, setSyncLabelDeny] = useState("")
+  const [syncModifiedSince, setSyncModifiedSince] = useState("")
+  const [syncMaxContentSize, setSyncMaxContentSize] = useState("")
+
+  // Fetch sync settings
+  const { data: syncSettings } = useQuery({
+    queryKey: ["syncSettings"],
+    queryFn: settingsApi.getSyncSettings,
+  })
+
+  useEffect(() => {
+    if (syncSettings) {
+      setSyncIncludeArchived(syncSettings.includeArchived)
+      setSyncIncludeTrashed(syncSettings.includeTrashed)
+      setSyncLabelAllow(syncSettings.labelAllow.join(", "))
+      setSyncLabelDeny(syncSettings.labelDeny.join(", "))
+      setSyncModifiedSince(syncSettings.modifiedSince?.slice(0, 10) || "")
+      setSyncMaxContentSize(syncSettings.maxContentSize?.toString() || "")
+    }
+  }, [syncSettings])
+
   // Sync state with fetched data
   useEffect(() => {
     if (aiSettings) {
@@ -299,6 +324,24 @@ export default function SettingsPage() {
     },
   })
 
+  const updateSyncSettingsMutation = useMutation({
+    mutationFn: settingsApi.updateSyncSettings,
+    onSuccess: () => {
+      toast({
+        title: "Nastaveni ulozeno",
+        description: "Filtry synchronizace byly aktualizovany.",
+      })
+      queryClient.invalidateQueries({ queryKey: ["syncSettings"] })
+    },
+    onError: (error: Error) => {
+      toast({
+        title: "Chyba pri ukladani nastaveni",
+        description: error.message,
+        variant: "destructive",
+      })
+    },
+  })
+
   const isConnected = !!user?.keepEmail
 
   const handleProviderChange = (provider: "CLAUDE" | "OPENAI") => {
@@ -327,6 +370,23 @@ export default function SettingsPage() {
     })
   }
 
+  const handleSaveSyncSettings = () => {
+    const parseLabels = (value: string) =>
+      value.split(",").map((label) => label.trim()).filter(Boolean)
+    const maxContentSize = parseInt(syncMaxContentSize, 10)
+
+    updateSyncSettingsMutation.mutate({
+      includeArchived: syncIncludeArchived,
+      includeTrashed: syncIncludeTrashed,
+      labelAllow: parseLabels(syncLabelAllow),
+      labelDeny: parseLabels(syncLabelDeny),
+      modifiedSince: syncModifiedSince
+        ? new Date(syncModifiedSince).toISOString()
+        : null,
+      maxContentSize: maxContentSize > 0 ? maxContentSize : null,
+    })
+  }
+
   const handleResetPrompt = () => {
     setCustomPromptText(aiSettings?.defaultPrompt || "")
     setUseCustomPrompt(false)
@@ -994,6 +1054,93 @@ export default function SettingsPage() {
         </CardContent>
       </Card>
 
+      {/* Sync Filters */}
+      <Card>
+        <CardHeader>
+          <CardTitle className="flex items-center gap-2">
+            <Settings2 className="h-5 w-5 text-primary" />
+            Filtry synchronizace
+          </CardTitle>
+          <CardDescription>
+            Vyberte, ktere poznamky z Google Keep se maji synchronizovat
+          </CardDescription>
+        </CardHeader>
+        <CardContent className="space-y-4">
+          <div className="flex items-center justify-between">
+            <Label htmlFor="sync-archived">Vcetne archivovanych poznamek</Label>
+            <Switch
+              id="sync-archived"
+              checked={syncIncludeArchived}
+              onCheckedChange={setSyncIncludeArchived}
+            />
+          </div>
+          <div className="flex items-center justify-between">
+            <Label htmlFor="sync-trashed">Vcetne poznamek v kosi</Label>
+            <Switch
+              id="sync-trashed"
+              checked={syncIncludeTrashed}
+              onCheckedChange={setSyncIncludeTrashed}
+            />
+          </div>
+
+          <Separator />
+
+          <div className="grid gap-4 md:grid-cols-2">
+            <div className="space-y-2">
+              <Label htmlFor="sync-label-allow">Pouze stitky</Label>
+              <Input
+                id="sync-label-allow"
+                placeholder="napr. Prace, Napady"
+                value={syncLabelAllow}
+                onChange={(e) => setSyncLabelAllow(e.target.value)}
+              />
+              <p className="text-xs text-muted-foreground">
+                Oddelene carkou. Prazdne = vsechny stitky.
+              </p>
+            </div>
+            <div className="space-y-2">
+              <Label htmlFor="sync-label-deny">Vynechat stitky</Label>
+              <Input
+                id="sync-label-deny"
+                placeholder="napr. Nakup"
+                value={syncLabelDeny}
+                onChange={(e) => setSyncLabelDeny(e.target.value)}
+              />
+            </div>
+            <div className="space-y-2">
+              <Label htmlFor="sync-modified-since">Upravene od</Label>
+              <Input
+                id="sync-modified-since"
+                type="date"
+                value={syncModifiedSince}
+                onChange={(e) => setSyncModifiedSince(e.target.value)}
+              />
+            </div>
+            <div className="space-y-2">
+              <Label htmlFor="sync-max-size">Maximalni delka obsahu (znaku)</Label>
+              <Input
+                id="sync-max-size"
+                type="number"
+                min={1}
+                placeholder="Bez omezeni"
+                value={syncMaxContentSize}
+                onChange={(e) => setSyncMaxContentSize(e.target.value)}
+              />
+            </div>
+          </div>
+
+          <Button
+            onClick={handleSaveSyncSettings}
+            disabled={updateSyncSettingsMutation.isPending}
+          >
+            {updateSyncSettingsMutation.isPending ? (
+              <Loader2 className="mr-2 h-4 w-4 animate-spin" />
+            ) : null}
+            Ulozit filtry
+          </Button>
+        </CardContent>
+      </Card>
+
       {/* Account Info */}
       <Card>
         <CardHeader>
@@ -0,0 +1,118 @@
+import { NextResponse } from "next/server"
+import { getCurrentUser } from "@/lib/auth"
+import { db } from "@/lib/db"
+import { z } from "zod"
+import { getZodErrorMessage } from "@/lib/validations"
+
+const labelListSchema = z
+  .array(z.string().trim().min(1).max(100))
+  .max(100, "Prilis mnoho stitku")
+
+const updateSyncSettingsSchema = z.object({
+  includeArchived: z.boolean().optional(),
+  includeTrashed: z.boolean().optional(),
+  labelAllow: labelListSchema.optional(),
+  labelDeny: labelListSchema.optional(),
+  modifiedSince: z.string().datetime({ offset: true }).nullable().optional(),
+  maxContentSize: z.number().int().positive().nullable().optional(),
+})
+
+function toSettings(user: {
+  syncIncludeArchived: boolean
+  syncIncludeTrashed: boolean
+  syncLabelAllow: string[]
+  syncLabelDeny: string[]
+  syncModifiedSince: Date | null
+  syncMaxContentSize: number | null
+}) {
+  return {
+    includeArchived: user.syncIncludeArchived,
+    includeTrashed: user.syncIncludeTrashed,
+    labelAllow: user.syncLabelAllow,
+    labelDeny: user.syncLabelDeny,
+    modifiedSince: user.syncModifiedSince,
+    maxContentSize: user.syncMaxContentSize,
+  }
+}
+
+// GET - Get sync projection settings
+export async function GET() {
+  try {
+    const user = await getCurrentUser()
+    if (!user) {
+      return NextResponse.json({ error: "Unauthorized" }, { status: 401 })
+    }
+
+    return NextResponse.json(toSettings(user))
+  } catch (error) {
+    console.error("Get sync settings error:", error)
+    return NextResponse.json(
+      { error: "Failed to get sync settings" },
+      { status: 500 }
+    )
+  }
+}
+
+// PATCH - Update sync projection settings
+export async function PATCH(request: Request) {
+  try {
+    const user = await getCurrentUser()
+    if (!user) {
+      return NextResponse.json({ error: "Unauthorized" }, { status: 401 })
+    }
+
+    const body = await request.json()
+    const result = updateSyncSettingsSchema.safeParse(body)
+
+    if (!result.success) {
+      return NextResponse.json(
+        { error: getZodErrorMessage(result.error) },
+        { status: 400 }
+      )
+    }
+
+    const updates = result.data
+    const updateData: Record<string, unknown> = {}
+
+    if (updates.includeArchived !== undefined) {
+      updateData.syncIncludeArchived = updates.includeArchived
+    }
+    if (updates.includeTrashed !== undefined) {
+      updateData.syncIncludeTrashed = updates.includeTrashed
+    }
+    if (updates.labelAllow !== undefined) {
+      updateData.syncLabelAllow = Array.from(new Set(updates.labelAllow))
+    }
+    if (updates.labelDeny !== undefined) {
+      updateData.syncLabelDeny = Array.from(new Set(updates.labelDeny))
+    }
+    // null clears the cutoff / size limit
+    if (updates.modifiedSince !== undefined) {
+      updateData.syncModifiedSince = updates.modifiedSince
+        ? new Date(updates.modifiedSince)
+        : null
+    }
+    if (updates.maxContentSize !== undefined) {
+      updateData.syncMaxContentSize = updates.maxContentSize
+    }
+
+    const updatedUser =
+      Object.keys(updateData).length > 0
+        ? await db.user.update({
+            where: { id: user.id },
+            data: updateData,
+          })
+        : user
+
+    return NextResponse.json({
+      success: true,
+      settings: toSettings(updatedUser),
+    })
+  } catch (error) {
+    console.error("Update sync settings error:", error)
+    return NextResponse.json(
+      { error: "Failed to update sync settings" },
+      { status: 500 }
+    )
+  }
+}
@@ -296,6 +296,18 @@ export interface AiSettingsUpdate {
   customPrompt?: string | null
 }
 
+// Sync Settings Types
+export interface SyncSettings {
+  includeArchived: boolean
+  includeTrashed: boolean
+  labelAllow: string[]
+  labelDeny: string[]
+  modifiedSince: string | null
+  maxContentSize: number | null
+}
+
+export type SyncSettingsUpdate = Partial<SyncSettings>
+
 // Settings API
 export const settingsApi = {
   // API Key management
@@ -323,4 +335,14 @@ export const settingsApi = {
       method: "PATCH",
       body: JSON.stringify(data),
     }),
+
+  // Sync Settings
+  getSyncSettings: () =>
+    fetchAPI<SyncSettings>("/api/settings/sync"),
+
+  updateSyncSettings: (data: SyncSettingsUpdate) =>
+    fetchAPI<{ success: boolean; settings: SyncSettings }>("/api/settings/sync", {
+      method: "PATCH",
+      body: JSON.stringify(data),
+    }),
 }
@@ -3,7 +3,7 @@ Google Keep synchronization using gkeepapi.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
 import gkeepapi
@@ -16,6 +16,7 @@ class KeepSync:
 
     def __init__(self):
         self.keep = gkeepapi.Keep()
+        self.notes_skipped = 0
 
     def authenticate(self, email: str, password: str) -> Optional[str]:
         """
@@ -79,16 +80,27 @@ class KeepSync:
         email: str,
         master_token: str,
         include_archived: bool = False,
-        include_trashed: bool = False
+        include_trashed: bool = False,
+        label_allow: Optional[List[str]] = None,
+        label_deny: Optional[List[str]] = None,
+        modified_since: Optional[datetime] = None,
+        max_content_size: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Sync notes from Google Keep.
 
+        Filters are applied before a note is converted, cheapest first,
+        so excluded notes never have their content or labels rendered.
+
         Args:
             email: Google account email
             master_token: Master token for authentication
             include_archived: Include archived notes
             include_trashed: Include trashed notes
+            label_allow: Only include notes with at least one of these labels
+            label_deny: Exclude notes with any of these labels
+            modified_since: Only include notes updated at or after this time
+            max_content_size: Skip notes whose content is longer (in characters)
 
         Returns:
             List of note dictionaries
@@ -100,46 +112,57 @@ class KeepSync:
         logger.info("Syncing with Google Keep...")
         self.keep.sync()
 
+        allow = {name.casefold() for name in label_allow or []}
+        deny = {name.casefold() for name in label_deny or []}
+        since = _to_naive_utc(modified_since)
+
         # Get all notes
         notes = []
+        skipped = 0
         all_notes = self.keep.all()
 
         for note in all_notes:
-            # Skip list items (we only want top-level notes)
-            if note.type.name == 'List':
-                # For lists, get the items
-                content_parts = []
-                if hasattr(note, 'items'):
-                    for item in note.items:
-                        checkbox = "[x]" if item.checked else "[ ]"
-                        content_parts.append(f"{checkbox} {item.text}")
-                content = "\n".join(content_parts)
-            else:
-                content = note.text if hasattr(note, 'text') else ''
-
-            # Skip if no content
-            if not content and not note.title:
-                continue
-
-            # Check filters
+            # Check flag filters first (no conversion needed)
             if note.archived and not include_archived:
+                skipped += 1
                 continue
             if note.trashed and not include_trashed:
+                skipped += 1
                 continue
 
-            # Get labels
-            labels = []
-            if hasattr(note, 'labels'):
-                labels = [label.name for label in note.labels.all()]
-
             # Get timestamps
             created = None
             updated = None
             if hasattr(note, 'timestamps'):
-                if note.timestamps.created:
-                    created = note.timestamps.created.isoformat()
-                if note.timestamps.updated:
-                    updated = note.timestamps.updated.isoformat()
+                created = note.timestamps.created
+                updated = note.timestamps.updated
+
+            if since and (not updated or _to_naive_utc(updated) < since):
+                skipped += 1
+                continue
+
+            # Get labels (only once, reused for filtering and output)
+            labels = []
+            if hasattr(note, 'labels'):
+                labels = [label.name for label in note.labels.all()]
+
+            if allow or deny:
+                folded = {name.casefold() for name in labels}
+                if allow and not folded & allow:
+                    skipped += 1
+                    continue
+                if folded & deny:
+                    skipped += 1
+                    continue
+
+            content = self._render_content(note, max_content_size)
+            if content is None:
+                skipped += 1
+                continue
+
+            # Skip if no content
+            if not content and not note.title:
+                continue
 
             # Get color
             color = None
@@ -155,13 +178,48 @@ class KeepSync:
                 'archived': note.archived,
                 'trashed': note.trashed,
                 'color': color,
-                'created': created,
-                'updated': updated,
+                'created': created.isoformat() if created else None,
+                'updated': updated.isoformat() if updated else None,
             })
 
-        logger.info(f"Found {len(notes)} notes")
+        self.notes_skipped = skipped
+        logger.info(f"Found {len(notes)} notes ({skipped} excluded by sync settings)")
         return notes
 
+    @staticmethod
+    def _render_content(note, max_content_size: Optional[int] = None) -> Optional[str]:
+        """
+        Render note content as text.
+
+        Returns:
+            Content string, or None if it exceeds max_content_size
+        """
+        if note.type.name != 'List':
+            content = note.text if hasattr(note, 'text') else ''
+            if max_content_size and len(content) > max_content_size:
+                return None
+            return content
+
+        # For lists, render the items as checkboxes
+        content_parts = []
+        size = 0
+        if hasattr(note, 'items'):
+            for item in note.items:
+                checkbox = "[x]" if item.checked else "[ ]"
+                part = f"{checkbox} {item.text}"
+                size += len(part) + (1 if content_parts else 0)
+                if max_content_size and size > max_content_size:
+                    return None
+                content_parts.append(part)
+        return "\n".join(content_parts)
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a datetime to naive UTC for comparison."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 def test_connection():
     """Test Google Keep connection (for debugging)."""
@@ -75,6 +75,25 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 # Queue names
 KEEP_SYNC_QUEUE = 'keep-sync'
 
+# Job retention (worker bypasses BullMQ, so removeOnComplete/removeOnFail are not applied)
+JOB_RETENTION = {
+    'completed': {
+        'max_count': int(os.getenv('JOB_RETENTION_COMPLETED_COUNT', '100')),
+        'max_age': int(os.getenv('JOB_RETENTION_COMPLETED_AGE', '86400')),
+    },
+    'failed': {
+        'max_count': int(os.getenv('JOB_RETENTION_FAILED_COUNT', '50')),
+        'max_age': int(os.getenv('JOB_RETENTION_FAILED_AGE', '604800')),
+    },
+}
+JOB_TRIM_INTERVAL = int(os.getenv('JOB_TRIM_INTERVAL', '60'))
+JOB_TRIM_BATCH_SIZE = max(1, int(os.getenv('JOB_TRIM_BATCH_SIZE', '500')))
+# Active jobs older than this (seconds) were left behind by a crashed worker
+JOB_STALLED_AGE = int(os.getenv('JOB_STALLED_AGE', '3600'))
+
+# Credentials that must not outlive the job in Redis
+SENSITIVE_JOB_FIELDS = ('password', 'appPassword', 'oauthToken')
+
 
 def get_redis_connection():
     """Create Redis connection."""
@@ -192,6 +211,116 @@ def master_login_with_password(email: str, app_password: str) -> str:
         raise ValueError(f"Prihlaseni selhalo: {str(e)}")
 
 
+def scrub_job_data(r, job_key: str, job_data: dict):
+    """
+    Remove credentials from the job data stored in Redis.
+
+    Redis errors are logged, not raised, so they never mask the job result.
+    """
+    if not any(field in job_data for field in SENSITIVE_JOB_FIELDS):
+        return
+
+    scrubbed = {k: v for k, v in job_data.items() if k not in SENSITIVE_JOB_FIELDS}
+    try:
+        r.hset(job_key, 'data', json.dumps(scrubbed))
+    except redis.RedisError as e:
+        logger.error(f"Failed to scrub job data for {job_key}: {str(e)}")
+
+
+def trim_finished_jobs(r, queue_prefix: str, state: str, max_count: int, max_age: int) -> int:
+    """
+    Remove old jobs from a finished-state set together with their job hashes.
+
+    Jobs older than max_age seconds are removed first, then the oldest jobs
+    beyond max_count. max_age <= 0 disables the age limit, max_count < 0
+    disables the count limit. Work is done in batches of JOB_TRIM_BATCH_SIZE.
+
+    Returns:
+        Number of removed jobs
+    """
+    set_key = f'{queue_prefix}:{state}'
+    removed = 0
+
+    while True:
+        job_ids = []
+        if max_age > 0:
+            cutoff = time.time() - max_age
+            job_ids = r.zrangebyscore(set_key, '-inf', cutoff, start=0, num=JOB_TRIM_BATCH_SIZE)
+
+        if not job_ids and max_count >= 0:
+            excess = r.zcard(set_key) - max_count
+            if excess > 0:
+                job_ids = r.zrange(set_key, 0, min(excess, JOB_TRIM_BATCH_SIZE) - 1)
+
+        if not job_ids:
+            return removed
+
+        pipe = r.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.delete(f'{queue_prefix}:{job_id}', f'{queue_prefix}:{job_id}:logs')
+        pipe.zrem(set_key, *job_ids)
+        pipe.execute()
+        removed += len(job_ids)
+
+
+def fail_stalled_jobs(r, queue_prefix: str) -> int:
+    """
+    Move jobs stuck in the active set to the failed set.
+
+    A job stays active only if the worker died while processing it. Such
+    jobs are scrubbed and marked failed so retention trimming removes them.
+
+    Returns:
+        Number of failed jobs
+    """
+    active_key = f'{queue_prefix}:active'
+    failed = 0
+
+    while True:
+        cutoff = time.time() - JOB_STALLED_AGE
+        job_ids = r.zrangebyscore(active_key, '-inf', cutoff, start=0, num=JOB_TRIM_BATCH_SIZE)
+        if not job_ids:
+            return failed
+
+        now = time.time()
+        for job_id in job_ids:
+            job_key = f'{queue_prefix}:{job_id}'
+            job_data_json = r.hget(job_key, 'data')
+            if job_data_json:
+                scrub_job_data(r, job_key, json.loads(job_data_json))
+
+            pipe = r.pipeline(transaction=False)
+            pipe.hset(job_key, mapping={
+                'failedReason': 'Job stalled (worker stopped while processing)',
+                'finishedOn': int(now * 1000),
+            })
+            pipe.zrem(active_key, job_id)
+            pipe.zadd(f'{queue_prefix}:failed', {job_id: now})
+            pipe.execute()
+        failed += len(job_ids)
+
+
+def trim_all_finished_jobs(r, queue_prefix: str):
+    """Fail stalled active jobs, then apply JOB_RETENTION to completed and failed jobs."""
+    try:
+        stalled = fail_stalled_jobs(r, queue_prefix)
+        if stalled:
+            logger.warning(f"Marked {stalled} stalled active jobs as failed")
+    except redis.RedisError as e:
+        logger.error(f"Failed to clean up stalled jobs: {str(e)}")
+
+    for state, retention in JOB_RETENTION.items():
+        try:
+            removed = trim_finished_jobs(
+                r, queue_prefix, state,
+                retention['max_count'], retention['max_age']
+            )
+            if removed:
+                logger.info(f"Trimmed {removed} {state} jobs")
+        except redis.RedisError as e:
+            logger.error(f"Failed to trim {state} jobs: {str(e)}")
+
+
 def process_sync_job(job_data: dict):
     """Process a sync job from the queue."""
     user_id = job_data.get('userId')
@@ -300,7 +429,10 @@ def process_sync_job(job_data: dict):
             try:
                 with conn.cursor() as cur:
                     cur.execute("""
-                        SELECT "keepEmail", "keepMasterToken", "keepTokenIv"
+                        SELECT "keepEmail", "keepMasterToken", "keepTokenIv",
+                               "syncIncludeArchived", "syncIncludeTrashed",
+                               "syncLabelAllow", "syncLabelDeny",
+                               "syncModifiedSince", "syncMaxContentSize"
                         FROM "User"
                         WHERE id = %s
                     """, (user_id,))
@@ -311,11 +443,17 @@ def process_sync_job(job_data: dict):
             if not user or not user['keepMasterToken']:
                 raise ValueError("User not connected to Google Keep")
 
-            # Sync notes from Google Keep
+            # Sync notes from Google Keep, applying user's sync projection
             sync = KeepSync()
             notes = sync.sync_notes(
                 email=user['keepEmail'],
-                master_token=user['keepMasterToken']
+                master_token=user['keepMasterToken'],
+                include_archived=user['syncIncludeArchived'],
+                include_trashed=user['syncIncludeTrashed'],
+                label_allow=user['syncLabelAllow'],
+                label_deny=user['syncLabelDeny'],
+                modified_since=user['syncModifiedSince'],
+                max_content_size=user['syncMaxContentSize']
             )
 
             # Save notes to database
@@ -396,12 +534,13 @@ def process_sync_job(job_data: dict):
                     cur.execute("""
                         INSERT INTO "SyncLog" (
                             id, "userId", "startedAt", "completedAt",
-                            status, "notesFound", "notesCreated", "notesUpdated"
+                            status, "notesFound", "notesCreated", "notesUpdated",
+                            "notesSkipped"
                         ) VALUES (
                             gen_random_uuid()::text, %s, NOW(), NOW(),
-                            'SUCCESS', %s, %s, %s
+                            'SUCCESS', %s, %s, %s, %s
                         )
-                    """, (user_id, len(notes), notes_created, notes_updated))
+                    """, (user_id, len(notes), notes_created, notes_updated, sync.notes_skipped))
                     conn.commit()
 
             finally:
@@ -429,9 +568,15 @@ def main():
     logger.info(f"Connected to Redis: {REDIS_URL}")
 
     queue_prefix = f'bull:{KEEP_SYNC_QUEUE}'
+    last_trim = time.monotonic() - JOB_TRIM_INTERVAL
 
     while True:
         try:
+            # Periodically enforce job retention so Redis memory stays bounded
+            if time.monotonic() - last_trim >= JOB_TRIM_INTERVAL:
+                trim_all_finished_jobs(r, queue_prefix)
+                last_trim = time.monotonic()
+
             # BullMQ uses list for waiting jobs
             # BRPOP blocks until a job is available (timeout in seconds)
             result = r.brpop(f'{queue_prefix}:wait', timeout=5)
@@ -453,7 +598,10 @@ def main():
                         # Move job to active state
                         r.zadd(f'{queue_prefix}:active', {job_id: time.time()})
 
-                        process_sync_job(job_data)
+                        try:
+                            process_sync_job(job_data)
+                        finally:
+                            scrub_job_data(r, job_key, job_data)
 
                         # Mark job as completed in BullMQ format
                         # Update job state in hash